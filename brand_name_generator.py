@@ -1,24 +1,33 @@
+import csv
+import hashlib
+import html
+import json
 import os
-from typing import List, Dict, Any
+import random
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from io import BytesIO, StringIO
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple, TypeVar
 
 import streamlit as st
-import pandas as pd
+
+try:
+    import httpx  # type: ignore
+except ImportError:  # The app falls back to demo names without it.
+    httpx = None
+
+T = TypeVar("T")
 
 
 APP_TITLE = "🏷️ ALwrity AI Brand Name Generator"
 PRIMARY_COLOR = "#1565C0"
 PRIMARY_LIGHT = "#90CAF9"
 
-
-def configure_page() -> None:
-    st.set_page_config(
-        page_title="ALwrity Brand Name Generator",
-        page_icon="🏷️",
-        layout="wide",
-    )
-
-    st.markdown(
-        f"""
+# Static page chrome; formatted once here rather than inside the render functions.
+_CSS_HTML = f"""
         <style>
         :root {{
           --primary: {PRIMARY_COLOR};
@@ -32,6 +41,16 @@ def configure_page() -> None:
             color: #3b3b3b;
             font-size: 0.95rem;
         }}
+        .alwrity-grid {{
+            display: grid;
+            grid-template-columns: repeat(3, minmax(0, 1fr));
+            gap: 1rem;
+        }}
+        @media (max-width: 640px) {{
+            .alwrity-grid {{
+                grid-template-columns: 1fr;
+            }}
+        }}
         .alwrity-card {{
             border: 1px solid rgba(21, 101, 192, 0.15);
             border-radius: 10px;
@@ -60,48 +79,464 @@ def configure_page() -> None:
             border: 1px solid var(--primary) !important;
         }}
         </style>
-        """,
-        unsafe_allow_html=True,
+        """
+
+_HEADER_HTML = f"""
+        <div class="alwrity-header">
+            <h1>{APP_TITLE}</h1>
+            <div class="alwrity-subtitle">Generate creative, unique, and brandable names powered by Gemini.</div>
+        </div>
+        """
+
+# Kept on one line: blank lines or indentation inside the joined grid would
+# end the HTML block and let Markdown render the rest as a code block.
+_CARD_HTML = '<div class="alwrity-card"><div class="alwrity-name">{name}</div></div>'
+
+LANGUAGE_OPTIONS = (
+    "English",
+    "Spanish",
+    "French",
+    "German",
+    "Italian",
+    "Portuguese",
+    "Dutch",
+    "Japanese",
+    "Korean",
+    "Chinese",
+    "Hindi",
+    "Arabic",
+    "Latin",
+)
+STYLE_OPTIONS = (
+    "Modern & Tech",
+    "Classic & Traditional",
+    "Creative & Unique",
+    "Elegant & Premium",
+    "Playful & Friendly",
+    "Minimal & Clean",
+)
+LENGTH_OPTIONS = ("Any", "Short", "Medium", "Long")
+
+API_BASE_URL = "https://generativelanguage.googleapis.com"
+MODEL_NAME = "gemini-2.5-flash"
+GENERATION_CONFIG = {
+    "temperature": 0.7,
+    "topP": 0.4,
+    # Fifteen short names fit in well under 256 tokens.
+    "maxOutputTokens": 256,
+    # Thinking tokens count against maxOutputTokens and delay the first name;
+    # a plain list of names does not need them.
+    "thinkingConfig": {"thinkingBudget": 0},
+}
+REQUEST_TIMEOUT = 60.0
+CONNECT_TIMEOUT = 5.0
+RETRY_ATTEMPTS = 3
+RETRY_DEADLINE = 20.0
+RATE_LIMIT_THRESHOLD = 2
+RATE_LIMIT_COOLDOWN = 30.0
+RATE_LIMIT_KEYS = 256
+RESPONSE_CACHE_TTL = 3600
+RESPONSE_CACHE_SIZE = 256
+
+# Optional list marker -- numbering ("1) ", "1. ", "1] ", "1 - ", "1: ") or a
+# bullet ("- ", "* ", "+ ", "• ") -- followed by the name.
+_NAME_RE = re.compile(r"^\s*(?:\d+\s*[\]\).\-:]\s+|[-*+•]\s*)?(.+?)\s*$")
+# Unicode categories (punctuation, separators, symbols) dropped from names
+# before comparing, so "NovaTech" and "Nova-Tech" match. Combining marks stay:
+# Devanagari vowel signs and Arabic diacritics tell names apart.
+_IGNORED_CATEGORIES = ("P", "Z", "S")
+
+# Invariant instructions sent as the system instruction, so every request
+# shares the same prefix and only the per-brand details vary.
+_SYSTEM_INSTRUCTION = (
+    "You are an expert brand strategist who creates unique, distinctive, and brandable "
+    "company and product names.\n\n"
+    "Uniqueness requirements: Focus on coined, blended, or metaphorical names. "
+    "Favor slight neologisms, portmanteaus, or evocative roots. Avoid direct dictionary words unless fresh.\n\n"
+    "Constraints:\n- "
+    + "\n- ".join(
+        [
+            "Each name should be easy to spell and pronounce",
+            "Avoid hyphens, numbers, and hard-to-spell words",
+            "Prefer short, distinctive names (or as per length preference)",
+            "Avoid generic terms and overused suffixes",
+            "Names must be culturally appropriate for the selected language and market",
+            "Return one name per line as a numbered list",
+        ]
+    )
+    + "\n\n"
+    "Output format: Provide only the names as a numbered list without descriptions."
+)
+
+# Per-request details; empty fields are filled from _PROMPT_DEFAULTS.
+_PROMPT_TEMPLATE = (
+    "Generate {num_names} unique, distinctive, and brandable "
+    "company or product names in {language}.\n\n"
+    "Business type: {business_type}\n"
+    "Brand values/keywords: {keywords}\n"
+    "Brand personality: {personality}\n"
+    "Desired style: {style}\n"
+    "{length_line}"
+    "Target market: {target_market}"
+)
+_PROMPT_DEFAULTS = {
+    "business_type": "General",
+    "keywords": "brandable, memorable",
+    "personality": "Modern, friendly, professional",
+    "style": "Creative & Unique",
+    "target_market": "Global",
+}
+
+# Returned when the Gemini API is unavailable so the app stays usable locally.
+_FALLBACK_RESPONSE = (
+    "1) Novaly\n"
+    "2) Bluemint\n"
+    "3) Nexora\n"
+    "4) Lumexa\n"
+    "5) Verityx"
+)
+
+
+def configure_page() -> None:
+    st.set_page_config(
+        page_title="ALwrity Brand Name Generator",
+        page_icon="🏷️",
+        layout="wide",
+    )
+
+    st.markdown(_CSS_HTML, unsafe_allow_html=True)
+
+
+class _ResponseCache:
+    """Thread-safe LRU of Gemini responses with a time-to-live."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, text = entry
+            if time.monotonic() - stored_at > self._ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return text
+
+    def put(self, key: str, text: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), text)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+@st.cache_resource(show_spinner=False)
+def _response_cache() -> _ResponseCache:
+    # Streamlit re-executes this script on every rerun, so a plain module-level
+    # dict would start empty each time; cache_resource keeps one per process.
+    return _ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+
+
+class _CircuitOpenError(RuntimeError):
+    """Raised instead of calling the API while the rate-limit breaker is open."""
+
+
+class _RateLimitBreaker:
+    """Pauses API calls for a cooldown after consecutive 429 responses."""
+
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._consecutive = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+
+    def check(self) -> None:
+        if self.is_open():
+            raise _CircuitOpenError("Gemini rate limit reached; pausing requests")
+
+    def record(self, status_code: int) -> None:
+        with self._lock:
+            if status_code == 429:
+                self._consecutive += 1
+                if self._consecutive >= self._threshold:
+                    self._open_until = time.monotonic() + self._cooldown
+                    self._consecutive = 0
+            elif status_code < 400:
+                self._consecutive = 0
+
+
+class _BreakerRegistry:
+    """Thread-safe LRU of rate-limit breakers, one per API key hash."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._breakers: "OrderedDict[str, _RateLimitBreaker]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> _RateLimitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = _RateLimitBreaker(RATE_LIMIT_THRESHOLD, RATE_LIMIT_COOLDOWN)
+                self._breakers[key] = breaker
+            self._breakers.move_to_end(key)
+            # Keys pasted into a public deployment would otherwise pile up.
+            while len(self._breakers) > self._maxsize:
+                self._breakers.popitem(last=False)
+            return breaker
+
+
+@st.cache_resource(show_spinner=False)
+def _rate_limit_breakers() -> _BreakerRegistry:
+    return _BreakerRegistry(RATE_LIMIT_KEYS)
+
+
+def _rate_limit_breaker(api_key: str) -> _RateLimitBreaker:
+    """Return the breaker for ``api_key``.
+
+    Gemini quotas are per key and visitors can paste their own, so one
+    exhausted key must not pause requests made with the others. Keys are
+    hashed so they are not held in plain text.
+    """
+    key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    return _rate_limit_breakers().get(key_hash)
+
+
+def _is_rate_limited(exc: Optional[BaseException]) -> bool:
+    """True if ``exc`` means Gemini is throttling the API key."""
+    if isinstance(exc, _CircuitOpenError):
+        return True
+    return (
+        httpx is not None
+        and isinstance(exc, httpx.HTTPStatusError)
+        and exc.response.status_code == 429
     )
 
 
-def gemini_text_response(prompt: str, api_key: str) -> str:
-    """Call Gemini API to get a text response.
+def _cache_key(prompt: str) -> str:
+    # Inputs that differ only in letter case or spacing produce the same names,
+    # so normalize them away before hashing to let such prompts share an entry.
+    normalized = " ".join(prompt.split()).casefold()
+    payload = {
+        "model": MODEL_NAME,
+        "system": _SYSTEM_INSTRUCTION,
+        "prompt": normalized,
+        "cfg": GENERATION_CONFIG,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_client() -> Any:
+    """Return the Gemini HTTP client, shared by all sessions to reuse connections.
 
-    This implementation is a lightweight placeholder to keep the app runnable
-    if google-generativeai is not available at runtime. If the package is
-    available and an API key is provided, it will use the real API.
+    httpx clients are thread-safe, so one pool serves every session's script
+    thread and a new visitor skips the TCP/TLS handshake.
     """
+    if httpx is None:
+        raise RuntimeError("httpx is not installed")
+    # Name resolution and the TCP/TLS handshake fall under the connect
+    # timeout, so an unreachable host fails fast instead of eating the
+    # whole retry deadline.
+    timeout = httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT)
     try:
-        import google.generativeai as genai  # type: ignore
-        from tenacity import retry, stop_after_attempt, wait_exponential  # type: ignore
-
-        genai.configure(api_key=api_key)
-
-        @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=6))
-        def _generate() -> str:
-            model = genai.GenerativeModel("gemini-2.5-flash")
-            response = model.generate_content(
-                prompt,
-                generation_config={
-                    "temperature": 0.7,
-                    "top_p": 0.4,
-                    "max_output_tokens": 1024,
-                },
-            )
-            return response.text or ""
+        return httpx.Client(http2=True, timeout=timeout, base_url=API_BASE_URL)
+    except ImportError:
+        # The optional h2 package is missing; HTTP/1.1 keep-alive still works.
+        return httpx.Client(timeout=timeout, base_url=API_BASE_URL)
 
-        return _generate()
-    except Exception:
-        # Fallback for local demo without API
-        return (
-            "1) Novaly\n"
-            "2) Bluemint\n"
-            "3) Nexora\n"
-            "4) Lumexa\n"
-            "5) Verityx"
+
+def _request_headers(api_key: str) -> Dict[str, str]:
+    if not api_key:
+        raise ValueError("A Gemini API key is required")
+    return {"X-goog-api-key": api_key, "Content-Type": "application/json"}
+
+
+def _request_body(prompt: str) -> Dict[str, Any]:
+    return {
+        "systemInstruction": {"parts": [{"text": _SYSTEM_INSTRUCTION}]},
+        "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+        "generationConfig": GENERATION_CONFIG,
+    }
+
+
+def _response_text(payload: Dict[str, Any]) -> str:
+    candidates = payload.get("candidates") or []
+    if not candidates:
+        return ""
+    parts = candidates[0].get("content", {}).get("parts", [])
+    return "".join(part.get("text", "") for part in parts)
+
+
+def _finish_reason(payload: Dict[str, Any]) -> Optional[str]:
+    candidates = payload.get("candidates") or []
+    return candidates[0].get("finishReason") if candidates else None
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Timeouts, dropped connections, 429 and 5xx are worth retrying; nothing else is."""
+    if httpx is None:
+        return False
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def _retry_after(exc: Exception) -> Optional[float]:
+    """Return the server's retry hint in seconds, if it sent one.
+
+    Checks the Retry-After header, then the ``retryDelay`` (e.g. "12s") that
+    Gemini puts in the RetryInfo detail of a 429 error body.
+    """
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    value = response.headers.get("retry-after")
+    if not value:
+        try:
+            details = response.json().get("error", {}).get("details", [])
+        except Exception:
+            return None
+        value = next((d["retryDelay"] for d in details if "retryDelay" in d), "")
+    try:
+        return max(0.0, float(value.rstrip("s"))) if value else None
+    except ValueError:
+        # HTTP-date form; fall back to our own backoff.
+        return None
+
+
+def _call_with_backoff(
+    fn: Callable[[], T],
+    tries: int = RETRY_ATTEMPTS,
+    base: float = 1.0,
+    cap: float = 6.0,
+    deadline: float = RETRY_DEADLINE,
+) -> T:
+    """Call ``fn``, retrying transient failures with full-jitter exponential backoff.
+
+    Permanent errors (bad key, bad request, open circuit) are raised at once.
+    A Retry-After hint from the server replaces the jittered wait. Stops
+    retrying once the next wait would push the total time past ``deadline``
+    seconds, so the spinner never hangs on a failing API.
+    """
+    start = time.monotonic()
+    for attempt in range(tries - 1):
+        try:
+            return fn()
+        except Exception as exc:
+            if not _is_transient(exc):
+                raise
+            delay = _retry_after(exc)
+            if delay is None:
+                delay = random.uniform(0, min(cap, base * 2 ** attempt))
+            if time.monotonic() - start + delay > deadline:
+                raise
+            time.sleep(delay)
+    return fn()
+
+
+def gemini_text_stream(
+    prompt: str,
+    api_key: str,
+    use_cache: bool = True,
+    status: Optional[Dict[str, Any]] = None,
+) -> Iterator[str]:
+    """Yield the Gemini response line by line while it is being generated.
+
+    Responses are cached by a hash of the prompt, model, and generation config:
+    cached responses are replayed immediately unless ``use_cache`` is false, and
+    a stream that ends with finishReason STOP is stored. Falls back to the demo
+    names if the request cannot be started, e.g. without httpx or an API key.
+
+    Pass a ``status`` dict to learn how it went: ``status["fallback"]`` holds
+    the error that forced the demo names, and ``status["complete"]`` is set
+    once the lines came from a response that is in the cache.
+    """
+    if status is None:
+        status = {}
+    key = _cache_key(prompt)
+    cached = _response_cache().get(key) if use_cache else None
+    if cached is not None:
+        yield from cached.splitlines()
+        status["complete"] = True
+        return
+
+    try:
+        client = _get_client()
+        request = client.build_request(
+            "POST",
+            f"/v1beta/models/{MODEL_NAME}:streamGenerateContent",
+            params={"alt": "sse"},
+            headers=_request_headers(api_key),
+            json=_request_body(prompt),
         )
 
+        breaker = _rate_limit_breaker(api_key)
+
+        def _open_stream() -> Any:
+            breaker.check()
+            response = client.send(request, stream=True)
+            breaker.record(response.status_code)
+            if response.is_error:
+                # Read the short error body (it may carry a retry delay);
+                # this also releases the connection.
+                response.read()
+                response.raise_for_status()
+            return response
+
+        response = _call_with_backoff(_open_stream)
+    except Exception as exc:
+        status["fallback"] = exc
+        yield from _FALLBACK_RESPONSE.splitlines()
+        return
+
+    received: List[str] = []
+    buffer = ""
+    finish_reason = None
+    try:
+        for event in response.iter_lines():
+            # Server-sent events: each "data:" line holds one JSON chunk.
+            if not event.startswith("data:"):
+                continue
+            payload = json.loads(event[len("data:"):])
+            piece = _response_text(payload)
+            # Only the final chunk carries it.
+            finish_reason = _finish_reason(payload) or finish_reason
+            received.append(piece)
+            buffer += piece
+            while "\n" in buffer:
+                line, buffer = buffer.split("\n", 1)
+                yield line
+    except Exception:
+        # Keep whatever arrived before the stream broke, but do not cache it.
+        if buffer:
+            yield buffer
+        return
+    finally:
+        response.close()
+
+    if finish_reason != "STOP":
+        # Cut off (e.g. MAX_TOKENS) or blocked: the unterminated last line may
+        # be half a name, so drop it and do not cache the response.
+        return
+    if buffer:
+        yield buffer
+    text = "".join(received)
+    if text:
+        _response_cache().put(key, text)
+        status["complete"] = True
+
 
 def build_prompt(
     business_type: str,
@@ -113,78 +548,58 @@ def build_prompt(
     target_market: str,
     num_names: int,
 ) -> str:
-    keywords_text = ", ".join([k.strip() for k in keywords if k.strip()]) or "brandable, memorable"
-    constraints = [
-        "Each name should be easy to spell and pronounce",
-        "Avoid hyphens, numbers, and hard-to-spell words",
-        "Prefer short, distinctive names (or as per length preference)",
-        "Avoid generic terms and overused suffixes",
-        "Names must be culturally appropriate for the selected language and market",
-        "Return one name per line as a numbered list",
-    ]
+    fields = {
+        "num_names": num_names,
+        "language": language,
+        "business_type": business_type,
+        # Strip once, then drop blanks, so stray commas add no empty entries.
+        "keywords": ", ".join(k for k in (part.strip() for part in keywords) if k),
+        "personality": personality,
+        "style": style,
+        # "Any" carries no constraint, so the line is left out entirely.
+        "length_line": f"Preferred length: {length}\n" if length and length != "Any" else "",
+        "target_market": target_market,
+    }
+    return _PROMPT_TEMPLATE.format_map(
+        {key: value or _PROMPT_DEFAULTS.get(key, value) for key, value in fields.items()}
+    )
 
-    return (
-        f"You are an expert brand strategist. Generate {num_names} unique, distinctive, and brandable "
-        f"company or product names in {language}.\n\n"
-        f"Business type: {business_type or 'General'}\n"
-        f"Brand values/keywords: {keywords_text}\n"
-        f"Brand personality: {personality or 'Modern, friendly, professional'}\n"
-        f"Desired style: {style or 'Creative & Unique'}\n"
-        f"Preferred length: {length or 'Any'}\n"
-        f"Target market: {target_market or 'Global'}\n\n"
-        "Uniqueness requirements: Focus on coined, blended, or metaphorical names. "
-        "Favor slight neologisms, portmanteaus, or evocative roots. Avoid direct dictionary words unless fresh.\n\n"
-        "Constraints:\n- " + "\n- ".join(constraints) + "\n\n"
-        "Output format: Provide only the names as a numbered list without descriptions."
+
+def _name_key(name: str) -> str:
+    """Return the de-duplication key: casefolded, without punctuation or spaces."""
+    key = "".join(
+        c for c in name.casefold() if unicodedata.category(c)[0] not in _IGNORED_CATEGORIES
     )
+    return key or name
 
 
-def parse_names(text: str, limit: int) -> List[str]:
-    candidates: List[str] = []
-    for raw in text.splitlines():
-        s = raw.strip()
-        if not s:
-            continue
-        # Strip common numbering patterns: "1) ", "1. ", "1 - ", "1:" etc.
-        for token in [")", ".", "-", ":"]:
-            if token + " " in s[:5]:
-                left, right = s.split(token + " ", 1)
-                if left.isdigit():
-                    s = right
-                    break
-        # Fallback: leading digits only
-        i = 0
-        while i < len(s) and s[i].isdigit():
-            i += 1
-        if i < len(s) and i > 0 and s[i:i+2] == ") ":
-            s = s[i+2:]
-        s = s.strip("- .:\t")
-        if s:
-            candidates.append(s)
-        if len(candidates) >= limit:
-            break
+def _iter_names(lines: Iterable[str], limit: int) -> Iterator[str]:
+    """Yield cleaned, de-duplicated names from response lines as they arrive."""
     seen = set()
-    result: List[str] = []
-    for name in candidates:
-        key = name.lower()
-        if key not in seen:
-            seen.add(key)
-            result.append(name)
-        if len(result) >= limit:
-            break
-    return result
+    lines = iter(lines)
+    for raw in lines:
+        m = _NAME_RE.match(raw)
+        if not m:
+            continue
+        # Also drops Markdown emphasis such as "**Novaly**".
+        name = m.group(1).strip("-* .:\t")
+        if not name:
+            continue
+        key = _name_key(name)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield name
+        if len(seen) >= limit:
+            # Drain the rest so a streamed response runs to completion and is
+            # cached; stopping here would leave the stream paused mid-yield.
+            for _ in lines:
+                pass
+            return
 
 
 def render_header() -> None:
-    st.markdown(
-        f"""
-        <div class="alwrity-header">
-            <h1>{APP_TITLE}</h1>
-            <div class="alwrity-subtitle">Generate creative, unique, and brandable names powered by Gemini.</div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 
 def render_sidebar() -> Dict[str, Any]:
@@ -198,42 +613,22 @@ def render_sidebar() -> Dict[str, Any]:
                 value=os.getenv("GEMINI_API_KEY", ""),
                 help="Optional. Set GEMINI_API_KEY env var or paste here.",
             )
-
-        language_options = [
-            "English",
-            "Spanish",
-            "French",
-            "German",
-            "Italian",
-            "Portuguese",
-            "Dutch",
-            "Japanese",
-            "Korean",
-            "Chinese",
-            "Hindi",
-            "Arabic",
-            "Latin",
-        ]
-
-        style_options = [
-            "Modern & Tech",
-            "Classic & Traditional",
-            "Creative & Unique",
-            "Elegant & Premium",
-            "Playful & Friendly",
-            "Minimal & Clean",
-        ]
-
-        length_options = ["Any", "Short", "Medium", "Long"]
+            reuse_results = st.checkbox(
+                "Reuse recent results",
+                value=True,
+                help="Return cached names for identical inputs from the last hour. "
+                "Turn off to always request fresh names.",
+            )
 
         st.subheader("Generation Settings")
         num_names = st.slider("How many names?", min_value=1, max_value=15, value=10)
-        language = st.selectbox("Language", options=language_options, index=0)
-        name_style = st.selectbox("Name Style", options=style_options, index=2)
-        name_length = st.selectbox("Name Length", options=length_options, index=0)
+        language = st.selectbox("Language", options=LANGUAGE_OPTIONS, index=0)
+        name_style = st.selectbox("Name Style", options=STYLE_OPTIONS, index=2)
+        name_length = st.selectbox("Name Length", options=LENGTH_OPTIONS, index=0)
 
     return {
         "api_key": api_key_input,
+        "reuse_results": reuse_results,
         "language": language,
         "name_style": name_style,
         "name_length": name_length,
@@ -270,53 +665,80 @@ def render_inputs() -> Dict[str, Any]:
 
     return {
         "business_type": business_type,
-        "keywords": [k.strip() for k in keywords.split(",") if k.strip()],
+        "keywords": keywords.split(","),
         "personality": personality,
         "target_market": target_market,
     }
 
 
-def render_results(names: List[str]) -> None:
+@st.cache_data(show_spinner=False)
+def _names_to_xlsx(names: Tuple[str, ...]) -> bytes:
+    from openpyxl import Workbook  # type: ignore
+
+    # Write-only mode streams rows out without building a cell object graph.
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(["Brand Name"])
+    for name in names:
+        sheet.append([name])
+    buffer = BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def _names_to_csv(names: Tuple[str, ...]) -> bytes:
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["Brand Name"])
+    writer.writerows([name] for name in names)
+    # The BOM lets Excel detect UTF-8, so non-Latin names open correctly.
+    return buffer.getvalue().encode("utf-8-sig")
+
+
+def render_results(names: List[str], show_download: bool = True) -> None:
     if not names:
         st.info("No names generated yet. Configure inputs and click Generate.")
         return
 
     st.subheader("Generated Names")
 
-    # Card grid
-    cols = st.columns(3)
-    for i, name in enumerate(names):
-        with cols[i % 3]:
-            st.markdown(
-                f"""
-                <div class="alwrity-card">
-                    <div class="alwrity-name">{name}</div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+    # Card grid, sent to the browser as a single element. Names come from the
+    # model, so escape them before they reach unsafe_allow_html.
+    cards = "".join(_CARD_HTML.format(name=html.escape(name)) for name in names)
+    st.markdown(f'<div class="alwrity-grid">{cards}</div>', unsafe_allow_html=True)
+
+    if not show_download:
+        return
 
-    df = pd.DataFrame({"Brand Name": names})
-    # Prepare Excel bytes for download
+    key = tuple(names)
     try:
-        from io import BytesIO
-        import pandas as _pd  # isolate import to ensure openpyxl engine is available
-
-        buffer = BytesIO()
-        with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
-            df.to_excel(writer, index=False)
-        buffer.seek(0)
-        excel_bytes = buffer.getvalue()
+        excel_bytes = _names_to_xlsx(key)
     except Exception:
         excel_bytes = b""
 
-    st.download_button(
-        "Download as Excel",
-        data=excel_bytes,
-        file_name="brand_names.xlsx",
-        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        disabled=len(excel_bytes) == 0,
-    )
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        st.download_button(
+            "Download as Excel",
+            data=excel_bytes,
+            file_name="brand_names.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            disabled=len(excel_bytes) == 0,
+        )
+    with col2:
+        st.download_button(
+            "Download as CSV",
+            data=_names_to_csv(key),
+            file_name="brand_names.csv",
+            mime="text/csv",
+        )
+
+
+@st.fragment
+def render_saved_results() -> None:
+    """Show the names kept in session state; download clicks rerun only this."""
+    render_results(st.session_state.get("generated_names", []))
 
 
 def main() -> None:
@@ -326,9 +748,23 @@ def main() -> None:
     sidebar_cfg = render_sidebar()
     inputs = render_inputs()
 
-    generate_clicked = st.button("Generate Brand Names", type="primary")
-
-    if generate_clicked:
+    col1, col2 = st.columns([1, 4])
+    with col1:
+        generate_clicked = st.button("Generate Brand Names", type="primary")
+    with col2:
+        regenerate_clicked = st.button(
+            "Regenerate",
+            help="Ask Gemini for fresh names even if these inputs were cached.",
+        )
+    # Names are previewed here while they stream in, then shown by the
+    # results fragment below.
+    preview = st.empty()
+
+    if generate_clicked or regenerate_clicked:
+        # Regenerate skips cached responses for this click only. A complete
+        # fresh result replaces the cache entry; if it fails, the old entry is
+        # kept and the next Generate replays it over the demo names.
+        reuse = sidebar_cfg["reuse_results"] and not regenerate_clicked
         prompt = build_prompt(
             business_type=inputs["business_type"],
             keywords=inputs["keywords"],
@@ -339,12 +775,43 @@ def main() -> None:
             target_market=inputs["target_market"],
             num_names=sidebar_cfg["num_names"],
         )
-        with st.spinner("Generating names..."):
-            response = gemini_text_response(prompt, api_key=sidebar_cfg["api_key"]) or ""
-            names = parse_names(response, limit=sidebar_cfg["num_names"])
-        render_results(names)
-    else:
-        render_results([])
+        input_key = _cache_key(prompt)
+        # Same inputs as the names on screen and a cached response: nothing to
+        # regenerate. _last_input_key is only kept for names that came from a
+        # complete response, so demo or partial names are always retried.
+        unchanged = (
+            reuse
+            and st.session_state.get("_last_input_key") == input_key
+            and _response_cache().get(input_key) is not None
+        )
+        if not unchanged:
+            names: List[str] = []
+            status: Dict[str, Any] = {}
+            with st.spinner("Generating names..."):
+                stream = gemini_text_stream(
+                    prompt,
+                    api_key=sidebar_cfg["api_key"],
+                    use_cache=reuse,
+                    status=status,
+                )
+                for name in _iter_names(stream, limit=sidebar_cfg["num_names"]):
+                    names.append(name)
+                    with preview.container():
+                        render_results(names, show_download=False)
+            preview.empty()
+            st.session_state["generated_names"] = names
+            if status.get("complete"):
+                st.session_state["_last_input_key"] = input_key
+            else:
+                st.session_state.pop("_last_input_key", None)
+            if _is_rate_limited(status.get("fallback")):
+                st.warning(
+                    "Gemini is rate limiting requests, so sample names are shown. "
+                    "Please try again in a moment."
+                )
+
+    # Results are kept in session state so they survive unrelated reruns.
+    render_saved_results()
 
 
 if __name__ == "__main__":